@@ -1,14 +1,13 @@
 import os
 import sys
+from typing import Dict, List, Tuple
 
-import pandas as pd
-
+from src.argument_handler import ArgumentHandler
 from src.config_loader import ConfigLoader
-from src.csv_consolidator import CSVConsolidator
 from src.csv_path_mapper import CSVPathMapper
 from src.custom_logger import CustomLogger
 from src.date_handler import DateHandler
-from src.excel_analyzer import ExcelAnalyzer
+from src.excel_builder import ExcelBuilder, ExcelJob
 from src.file_utility import FileUtility
 from src.processing_summary import ProcessingSummary
 from src.target_handler import TargetHandler
@@ -16,15 +15,75 @@ from src.target_handler import TargetHandler
 _CONFIG_FILE_PATH = os.path.join("config", "config.yml")
 
 
+def _create_excel_jobs(
+    targets_and_csv_path_by_dates: Dict[str, Dict[str, str | None]],
+    target_fullnames_by_prefix: Dict[str, List[str]],
+) -> Tuple[List[str], List[ExcelJob]]:
+    logger = CustomLogger.get_logger()
+
+    summary_keys: List[str] = []
+    excel_jobs: List[ExcelJob] = []
+
+    for (
+        date,
+        targets_and_csv_path,
+    ) in targets_and_csv_path_by_dates.items():
+        if all(csv_path is None for csv_path in targets_and_csv_path.values()):
+            logger.warning("No CSV files found for date %s.", date)
+            continue
+
+        for (
+            target_prefix,
+            prefixed_target_fullnames,
+        ) in target_fullnames_by_prefix.items():
+            extracted_targets_and_csv_path = {
+                target_fullname: targets_and_csv_path[target_fullname]
+                for target_fullname in prefixed_target_fullnames
+            }
+
+            if all(
+                csv_path is None
+                for csv_path in extracted_targets_and_csv_path.values()
+            ):
+                logger.warning(
+                    "No CSV files found for target prefix '%s' on date %s.",
+                    target_prefix,
+                    date,
+                )
+                continue
+
+            excel_path = FileUtility.create_date_based_excel_path(
+                date, target_prefix
+            )
+            summary_keys.append(date)
+            excel_jobs.append((excel_path, extracted_targets_and_csv_path))
+
+    return summary_keys, excel_jobs
+
+
 def main() -> None:
+    CustomLogger.configure()
+
     try:
         logger = CustomLogger.get_logger()
         logger.info("Process started.")
 
-        date_range = DateHandler.get_date_range_or_yesterday()
+        input_date, input_targets = ArgumentHandler.get_input_date_and_targets(
+            sys.argv
+        )
+        date_range = DateHandler.get_date_range_or_yesterday(input_date)
         config_loader = ConfigLoader(_CONFIG_FILE_PATH)
-        target_prefixes = TargetHandler.get_target_prefixes(config_loader)
-        target_fullnames = TargetHandler.get_target_fullnames(target_prefixes)
+        target_prefixes = TargetHandler.get_target_prefixes(
+            config_loader, input_targets
+        )
+        target_fullnames_by_prefix = (
+            TargetHandler.get_target_fullnames_by_prefix(target_prefixes)
+        )
+        target_fullnames = [
+            target_fullname
+            for target_fullnames in target_fullnames_by_prefix.values()
+            for target_fullname in target_fullnames
+        ]
         targets_and_csv_path_by_dates = (
             CSVPathMapper.get_targets_and_csv_paths_by_dates(
                 date_range, target_fullnames
@@ -36,68 +95,21 @@ def main() -> None:
         processing_summary = ProcessingSummary()
         processing_summary.add_missing_csv_info(targets_and_csv_path_by_dates)
 
-        for (
-            date,
-            targets_and_csv_path,
-        ) in targets_and_csv_path_by_dates.items():
-            if all(
-                csv_path is None for csv_path in targets_and_csv_path.values()
-            ):
-                logger.warning(f"No CSV files found for date {date}.")
-                continue
-
-            for target_prefix in target_prefixes:
-                extracted_targets_and_csv_path = {
-                    target_fullname: csv_path
-                    for target_fullname, csv_path in targets_and_csv_path.items()  # noqa E501
-                    if target_fullname.startswith(target_prefix)
-                }
-
-                if all(
-                    csv_path is None
-                    for csv_path in extracted_targets_and_csv_path.values()
-                ):
-                    logger.warning(
-                        "No CSV files found for"
-                        f" target prefix '{target_prefix}' on date {date}."
-                    )
-                    continue
-
-                excel_path = FileUtility.create_date_based_excel_path(
-                    date, target_prefix
-                )
-                FileUtility.create_directory(excel_path)
-
-                logger.info(f"Starting to create {excel_path}.")
-                with pd.ExcelWriter(
-                    excel_path, engine="openpyxl", mode="w"
-                ) as writer:
-                    workbook = writer.book
-
-                    csv_consolidator = CSVConsolidator(writer, workbook)
-                    csv_consolidator.consolidate_csvs_to_excel(
-                        extracted_targets_and_csv_path
-                    )
-
-                    excel_analyzer = ExcelAnalyzer(workbook)
-                    excel_analyzer.highlight_cells_and_sheet_tabs_by_criteria(
-                        processing_time_threshold
-                    )
-                    excel_analyzer.reorder_sheets_by_color()
-
-                    logger.info(f"Saving {excel_path}.")
+        summary_keys, excel_jobs = _create_excel_jobs(
+            targets_and_csv_path_by_dates, target_fullnames_by_prefix
+        )
 
-                processing_summary.save_daily_processing_results(
-                    date,
-                    csv_consolidator,
-                    excel_analyzer,
-                )
-                logger.info(f"Finished creating {excel_path}.")
+        excel_builder = ExcelBuilder(processing_time_threshold)
+        processing_results = excel_builder.build_excels(excel_jobs)
+        for summary_key, results in zip(summary_keys, processing_results):
+            processing_summary.save_daily_processing_results(
+                summary_key, results
+            )
 
         processing_summary.log_daily_summaries()
         logger.info("Process completed.")
     except Exception as e:
-        logger.error(f"An error occured: {e}", exc_info=True)
+        logger.error("An error occured: %s", e, exc_info=True)
         sys.exit(1)
 
 
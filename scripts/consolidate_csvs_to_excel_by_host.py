@@ -1,14 +1,13 @@
 import os
 import sys
+from typing import Dict, List, Tuple
 
-import pandas as pd
-
+from src.argument_handler import ArgumentHandler
 from src.config_loader import ConfigLoader
-from src.csv_consolidator import CSVConsolidator
 from src.csv_path_mapper import CSVPathMapper
 from src.custom_logger import CustomLogger
 from src.date_handler import DateHandler
-from src.excel_analyzer import ExcelAnalyzer
+from src.excel_builder import ExcelBuilder, ExcelJob
 from src.file_utility import FileUtility
 from src.processing_summary import ProcessingSummary
 from src.target_handler import TargetHandler
@@ -16,14 +15,50 @@ from src.target_handler import TargetHandler
 _CONFIG_FILE_PATH = os.path.join("config", "config.yml")
 
 
+def _create_excel_jobs(
+    targets_with_csv_path_for_each_date: Dict[str, Dict[str, str | None]],
+    target_fullnames: List[str],
+) -> Tuple[List[str], List[ExcelJob]]:
+    logger = CustomLogger.get_logger()
+
+    summary_keys: List[str] = []
+    excel_jobs: List[ExcelJob] = []
+
+    for target_fullname in target_fullnames:
+        csv_paths_for_each_date = targets_with_csv_path_for_each_date.get(
+            target_fullname
+        )
+
+        if csv_paths_for_each_date is None or all(
+            csv_path is None for csv_path in csv_paths_for_each_date.values()
+        ):
+            logger.warning("No CSV files found for host %s.", target_fullname)
+            continue
+
+        excel_path = FileUtility.create_target_based_excel_path(
+            target_fullname
+        )
+        summary_keys.append(target_fullname)
+        excel_jobs.append((excel_path, csv_paths_for_each_date))
+
+    return summary_keys, excel_jobs
+
+
 def main() -> None:
+    CustomLogger.configure()
+
     try:
         logger = CustomLogger.get_logger()
         logger.info("Process started.")
 
-        date_range = DateHandler.get_date_range_or_yesterday()
+        input_date, input_targets = ArgumentHandler.get_input_date_and_targets(
+            sys.argv
+        )
+        date_range = DateHandler.get_date_range_or_yesterday(input_date)
         config_loader = ConfigLoader(_CONFIG_FILE_PATH)
-        target_prefixes = TargetHandler.get_target_prefixes(config_loader)
+        target_prefixes = TargetHandler.get_target_prefixes(
+            config_loader, input_targets
+        )
         target_fullnames = TargetHandler.get_target_fullnames(target_prefixes)
 
         targets_with_csv_path_for_each_date = (
@@ -39,55 +74,21 @@ def main() -> None:
             targets_with_csv_path_for_each_date
         )
 
-        for target_fullname in target_fullnames:
-            csv_paths_for_each_date = targets_with_csv_path_for_each_date.get(
-                target_fullname
-            )
-
-            if csv_paths_for_each_date is None or all(
-                csv_path is None
-                for csv_path in csv_paths_for_each_date.values()
-            ):
-                logger.warning(
-                    f"No CSV files found for host {target_fullname}."
-                )
-                continue
-
-            excel_path = FileUtility.create_target_based_excel_path(
-                target_fullname
-            )
-            FileUtility.create_directory(excel_path)
-
-            logger.info(f"Starting to create {excel_path}.")
-            with pd.ExcelWriter(
-                excel_path, engine="openpyxl", mode="w"
-            ) as writer:
-                workbook = writer.book
-
-                csv_consolidator = CSVConsolidator(writer, workbook)
-                csv_consolidator.consolidate_csvs_to_excel(
-                    csv_paths_for_each_date
-                )
-
-                excel_analyzer = ExcelAnalyzer(workbook)
-                excel_analyzer.highlight_cells_and_sheet_tabs_by_criteria(
-                    processing_time_threshold
-                )
-                excel_analyzer.reorder_sheets_by_color()
-
-                logger.info(f"Saving {excel_path}.")
+        summary_keys, excel_jobs = _create_excel_jobs(
+            targets_with_csv_path_for_each_date, target_fullnames
+        )
 
+        excel_builder = ExcelBuilder(processing_time_threshold)
+        processing_results = excel_builder.build_excels(excel_jobs)
+        for summary_key, results in zip(summary_keys, processing_results):
             processing_summary.save_daily_processing_results(
-                target_fullname,
-                csv_consolidator,
-                excel_analyzer,
+                summary_key, results
             )
-            logger.info(f"Finished creating {excel_path}.")
 
         processing_summary.log_daily_summaries()
         logger.info("Process completed.")
     except Exception as e:
-        logger.error(f"An error occurred: {e}", exc_info=True)
+        logger.error("An error occurred: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -0,0 +1,20 @@
+from typing import List, Tuple
+
+_DATE_ARG_INDEX = 1
+_TARGETS_ARG_INDEX = 2
+
+
+class ArgumentHandler:
+    @staticmethod
+    def get_input_date_and_targets(
+        argv: List[str],
+    ) -> Tuple[str | None, str | None]:
+        input_date = (
+            argv[_DATE_ARG_INDEX] if len(argv) > _DATE_ARG_INDEX else None
+        )
+        input_targets = (
+            argv[_TARGETS_ARG_INDEX]
+            if len(argv) > _TARGETS_ARG_INDEX
+            else None
+        )
+        return input_date, input_targets
@@ -1,27 +1,130 @@
+import copy
+import json
 import os
-from typing import Any, Dict
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
 
 import yaml
 
 from src.custom_logger import CustomLogger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 _CONFIG_FILE_PATH = os.path.join("config", "config.yml")
+_CONFIG_CACHE_MAX_ENTRIES = 100
 
 
 class ConfigLoader:
     _logger = CustomLogger.get_logger()
+    _config_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = (
+        OrderedDict()
+    )
 
     def __init__(self, config_file_path: str = _CONFIG_FILE_PATH):
         self._config_file_path = config_file_path
         self._config: Dict[str, Any] = {}
 
+    @staticmethod
+    def _get_json_sidecar_path(config_file_path: str) -> str:
+        directory, file_name = os.path.split(config_file_path)
+        return os.path.join(directory, f".{file_name}.json")
+
+    @classmethod
+    def _read_json_sidecar(
+        cls, config_file_path: str, mtime_ns: int, size: int
+    ) -> Dict[str, Any] | None:
+        sidecar_path = cls._get_json_sidecar_path(config_file_path)
+        try:
+            with open(sidecar_path, "r") as file:
+                sidecar = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(sidecar, dict)
+            or sidecar.get("source_mtime_ns") != mtime_ns
+            or sidecar.get("source_size") != size
+        ):
+            return None
+        return sidecar.get("config")
+
+    @classmethod
+    def _write_json_sidecar(
+        cls,
+        config_file_path: str,
+        mtime_ns: int,
+        size: int,
+        config: Dict[str, Any],
+    ) -> None:
+        try:
+            if json.loads(json.dumps(config)) != config:
+                return
+        except (TypeError, ValueError):
+            return
+
+        sidecar_path = cls._get_json_sidecar_path(config_file_path)
+        sidecar = {
+            "source_mtime_ns": mtime_ns,
+            "source_size": size,
+            "config": config,
+        }
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(sidecar_path), suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "w") as file:
+                json.dump(sidecar, file)
+            os.replace(temp_path, sidecar_path)
+        except OSError as e:
+            cls._logger.warning(
+                "Failed to write config cache %s: %s", sidecar_path, e
+            )
+
+    @classmethod
+    def _parse_config_file(
+        cls, config_file_path: str, mtime_ns: int, size: int
+    ) -> Dict[str, Any]:
+        config = cls._read_json_sidecar(config_file_path, mtime_ns, size)
+        if config is not None:
+            return config
+
+        with open(config_file_path, "rb") as file:
+            config = yaml.load(file, Loader=_YamlLoader)
+
+        if isinstance(config, dict):
+            cls._write_json_sidecar(config_file_path, mtime_ns, size, config)
+        return config
+
+    @classmethod
+    def _load_yaml_cached(cls, config_file_path: str) -> Dict[str, Any]:
+        absolute_path = os.path.abspath(config_file_path)
+        file_stat = os.stat(absolute_path)
+        mtime_ns, size = file_stat.st_mtime_ns, file_stat.st_size
+
+        cached_entry = cls._config_cache.get(absolute_path)
+        if cached_entry is not None and cached_entry[:2] == (mtime_ns, size):
+            cls._config_cache.move_to_end(absolute_path)
+            return copy.deepcopy(cached_entry[2])
+
+        config = cls._parse_config_file(absolute_path, mtime_ns, size)
+
+        cls._config_cache[absolute_path] = (mtime_ns, size, config)
+        cls._config_cache.move_to_end(absolute_path)
+        if len(cls._config_cache) > _CONFIG_CACHE_MAX_ENTRIES:
+            cls._config_cache.popitem(last=False)
+
+        return copy.deepcopy(config)
+
     def _load_config(self) -> None:
         try:
-            with open(self._config_file_path, "r") as file:
-                self._config = yaml.safe_load(file)
+            self._config = self._load_yaml_cached(self._config_file_path)
             self._logger.info(
-                f"Configuration file {self._config_file_path}"
-                " loaded successfully."
+                "Configuration file %s loaded successfully.",
+                self._config_file_path,
             )
         except FileNotFoundError:
             raise FileNotFoundError(
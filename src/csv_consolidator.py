@@ -1,9 +1,10 @@
-from typing import Dict
+import csv
+from typing import Dict, List
 
-import pandas as pd
 from openpyxl import Workbook
 
 from src.custom_logger import CustomLogger
+from src.excel_analyzer import ExcelAnalyzer
 
 _TRANSPARENT = "FF"
 _GRAY = "7F7F7F"
@@ -13,37 +14,46 @@ _GRAY_WITH_TRANSPARENT = _TRANSPARENT + _GRAY
 class CSVConsolidator:
     _logger = CustomLogger.get_logger()
 
-    def __init__(self, writer: pd.ExcelWriter, workbook: Workbook) -> None:
-        self._writer = writer
+    def __init__(
+        self, workbook: Workbook, excel_analyzer: ExcelAnalyzer
+    ) -> None:
         self._workbook = workbook
+        self._excel_analyzer = excel_analyzer
         self._merge_failed_info: set[str] = set()
 
-    def _create_sentinel_sheet(self) -> None:
-        pd.DataFrame({"A": ["SENTINEL_SHEET"]}).to_excel(
-            self._writer,
-            sheet_name="SENTINEL_SHEET",
-            index=False,
-            header=False,
-        )
+    @staticmethod
+    def _read_csv_rows(csv_path: str) -> List[List[str]]:
+        with open(csv_path, newline="", encoding="utf-8-sig") as csv_file:
+            return [row for row in csv.reader(csv_file) if row]
 
     def _create_sheet_from_csv(self, sheet_name: str, csv_path: str) -> None:
         try:
-            df = pd.read_csv(csv_path)
-            df.to_excel(self._writer, sheet_name=sheet_name, index=False)
+            csv_rows = self._read_csv_rows(csv_path)
         except Exception as e:
-            self._logger.error(f"Failed to read CSV file at {csv_path}: {e}")
+            self._logger.error(
+                "Failed to read CSV file at %s: %s", csv_path, e
+            )
             self._merge_failed_info.add(sheet_name)
+            return
 
-    def _create_no_csv_sheet(self, sheet_name: str) -> None:
-        df_for_no_csv = pd.DataFrame({"A": ["No CSV file found."]})
-        df_for_no_csv.to_excel(
-            self._writer, sheet_name=sheet_name, index=False, header=False
-        )
+        if not csv_rows:
+            self._logger.error("CSV file at %s has no rows.", csv_path)
+            self._merge_failed_info.add(sheet_name)
+            return
 
-        self._writer.sheets[sheet_name].sheet_properties.tabColor = (
-            _GRAY_WITH_TRANSPARENT
+        sheet = self._workbook.create_sheet(sheet_name)
+        self._excel_analyzer.highlight_cells_and_sheet_tab_by_criteria(
+            sheet, csv_rows[1:]
         )
 
+        for row in csv_rows:
+            sheet.append(row)
+
+    def _create_no_csv_sheet(self, sheet_name: str) -> None:
+        no_csv_sheet = self._workbook.create_sheet(sheet_name)
+        no_csv_sheet.sheet_properties.tabColor = _GRAY_WITH_TRANSPARENT
+        no_csv_sheet.append(["No CSV file found."])
+
     def _create_sheets(
         self, csv_paths_for_each_date: dict[str, str | None]
     ) -> None:
@@ -58,22 +68,18 @@ class CSVConsolidator:
                 self._create_no_csv_sheet(sheet_name)
 
             self._logger.info(
-                f"Added sheet: {sheet_name}."
-                f" ({current_target_number}/{total_targets})"
+                "Added sheet: %s. (%d/%d)",
+                sheet_name,
+                current_target_number,
+                total_targets,
             )
 
-    def _delete_sentinel_sheet(self) -> None:
-        if "SENTINEL_SHEET" in self._workbook.sheetnames:
-            del self._workbook["SENTINEL_SHEET"]
-
     def consolidate_csvs_to_excel(
         self, csv_paths_for_each_date: dict[str, str | None]
     ) -> None:
         self._logger.info("Starting to merge.")
 
-        self._create_sentinel_sheet()
         self._create_sheets(csv_paths_for_each_date)
-        self._delete_sentinel_sheet()
 
         self._logger.info("Merging completed.")
 
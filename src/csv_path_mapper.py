@@ -12,12 +12,23 @@ class CSVPathMapper:
         date_range: List[str], target_fullnames: List[str]
     ) -> Dict[str, Dict[str, str | None]]:
         targets_and_csv_paths_by_dates = {}
+        target_folder_paths = {
+            target_fullname: os.path.join(
+                _TARGET_FOLDERS_BASE_PATH, target_fullname
+            )
+            for target_fullname in target_fullnames
+        }
+        file_names_by_targets = {
+            target_fullname: FileUtility.get_file_names(folder_path)
+            for target_fullname, folder_path in target_folder_paths.items()
+        }
 
         for date in date_range:
             targets_and_csv_paths = {
                 target_fullname: FileUtility.get_csv_path(
-                    os.path.join(_TARGET_FOLDERS_BASE_PATH, target_fullname),
+                    target_folder_paths[target_fullname],
                     date,
+                    file_names_by_targets[target_fullname],
                 )
                 for target_fullname in target_fullnames
             }
@@ -33,10 +44,14 @@ class CSVPathMapper:
         csv_path_for_each_date_by_targets = {}
 
         for target_fullname in target_fullnames:
+            target_folder_path = os.path.join(
+                _TARGET_FOLDERS_BASE_PATH, target_fullname
+            )
+            file_names = FileUtility.get_file_names(target_folder_path)
+
             csv_path_for_each_date = {
                 date: FileUtility.get_csv_path(
-                    os.path.join(_TARGET_FOLDERS_BASE_PATH, target_fullname),
-                    date,
+                    target_folder_path, date, file_names
                 )
                 for date in date_range
             }
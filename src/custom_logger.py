@@ -1,38 +1,36 @@
+import atexit
 import logging
+import multiprocessing
 import os
 import sys
 from logging import Logger
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 _LOG_FILE_PATH = os.path.join("log", "test.log")
+_PROCESS_START_METHOD = "spawn"
 
 
-class CustomLogger:  # pragma: no cover
-    _instance: Logger | None = None
+class CustomLogger:
+    _listener: QueueListener | None = None
+    _queue_handler: QueueHandler | None = None
+    _log_queue: "multiprocessing.Queue[logging.LogRecord] | None" = None
+
+    @staticmethod
+    def get_logger() -> Logger:
+        return logging.getLogger(__name__)
 
     @classmethod
-    def get_logger(
+    def configure(
         cls,
         log_file_path: str = _LOG_FILE_PATH,
         log_level: int = logging.INFO,
         max_file_size: int = 3 * 1024 * 1024,
         backup_count: int = 2,
-    ) -> Logger:
-        if cls._instance is None:
-            cls._instance = cls._initialize_logger(
-                log_file_path, log_level, max_file_size, backup_count
-            )
-        return cls._instance
+    ) -> None:
+        if cls._listener is not None:
+            return
 
-    @classmethod
-    def _initialize_logger(
-        cls,
-        log_file_path: str,
-        log_level: int,
-        max_file_size: int,
-        backup_count: int,
-    ) -> Logger:
-        logger = logging.getLogger(__name__)
+        logger = cls.get_logger()
         logger.setLevel(log_level)
 
         file_handler = RotatingFileHandler(
@@ -44,11 +42,57 @@ class CustomLogger:  # pragma: no cover
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
 
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
 
-        return logger
+        process_context = multiprocessing.get_context(_PROCESS_START_METHOD)
+        log_queue: multiprocessing.Queue[logging.LogRecord] = (
+            process_context.Queue()
+        )
+        cls._queue_handler = QueueHandler(log_queue)
+        logger.addHandler(cls._queue_handler)
+        cls._log_queue = log_queue
+
+        cls._listener = QueueListener(
+            log_queue,
+            file_handler,
+            console_handler,
+            respect_handler_level=True,
+        )
+        cls._listener.start()
+        atexit.register(cls.close)
+
+    @classmethod
+    def get_log_queue(
+        cls,
+    ) -> "multiprocessing.Queue[logging.LogRecord] | None":
+        return cls._log_queue
+
+    @classmethod
+    def initialize_worker(
+        cls,
+        log_queue: "multiprocessing.Queue[logging.LogRecord] | None",
+        log_level: int,
+    ) -> None:
+        if log_queue is None:
+            return
+
+        logger = cls.get_logger()
+        logger.setLevel(log_level)
+        logger.addHandler(QueueHandler(log_queue))
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._listener is None or cls._queue_handler is None:
+            return
+
+        cls.get_logger().removeHandler(cls._queue_handler)
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.close()
+
+        cls._listener = None
+        cls._queue_handler = None
+        cls._log_queue = None
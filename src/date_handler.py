@@ -1,7 +1,8 @@
 import datetime
-import sys
 from typing import List
 
+import numpy as np
+
 
 class DateHandler:
     _DATE_FORMAT = "%Y%m%d"
@@ -17,7 +18,9 @@ class DateHandler:
                 f" Input value: {input_date}"
             )
 
-        date = datetime.datetime.strptime(input_date, DateHandler._DATE_FORMAT)
+        date = datetime.datetime(
+            int(input_date[:4]), int(input_date[4:6]), int(input_date[6:])
+        )
 
         if date > datetime.datetime.now():
             raise ValueError(
@@ -33,24 +36,23 @@ class DateHandler:
         if start_date > end_date:
             start_date, end_date = end_date, start_date
 
-        current_date = start_date
-        date_list = []
-        while current_date <= end_date:
-            date_list.append(current_date.strftime(cls._DATE_FORMAT))
-            current_date += datetime.timedelta(days=1)
+        dates = np.arange(
+            np.datetime64(start_date.date()),
+            np.datetime64(end_date.date()) + np.timedelta64(1, "D"),
+            dtype="datetime64[D]",
+        )
+        iso_dates = np.datetime_as_string(dates, unit="D")
 
-        return date_list
+        return np.char.replace(iso_dates, "-", "").tolist()
 
     @classmethod
-    def get_date_range_or_yesterday(cls) -> List[str]:
-        DATE_INDEX = 1
-
-        if len(sys.argv) <= DATE_INDEX:
+    def get_date_range_or_yesterday(
+        cls, input_date: str | None = None
+    ) -> List[str]:
+        if input_date is None:
             yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
             return [yesterday.strftime(cls._DATE_FORMAT)]
 
-        input_date = sys.argv[DATE_INDEX]
-
         if cls._DATE_DELIMITER in input_date:
             start_date_str, end_date_str = input_date.split(
                 cls._DATE_DELIMITER
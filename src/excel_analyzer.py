@@ -1,37 +1,65 @@
 import json
-from typing import Dict, List
+import re
+from typing import Any, Dict, List
 
 from openpyxl import Workbook
-from openpyxl.cell import Cell
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
 from src.custom_logger import CustomLogger
 
-_HEADER_ROW = 1
-_DATA_START_ROW = _HEADER_ROW + 1
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 _ZERO_BASED_INDEX_OFFSET = 1
 _PROCESSING_TIME_COLUMN = 3 - _ZERO_BASED_INDEX_OFFSET
 _ALERT_DETAIL_COLUMN = 4 - _ZERO_BASED_INDEX_OFFSET
 
+_RANDOM_KEY_PATTERN = re.compile(r'"random_key"\s*:\s*true')
+
 _TRANSPARENT = "FF"
 _YELLOW = "FFFF7F"
 _GRAY = "7F7F7F"
 _YELLOW_WITH_TRANSPARENT = _TRANSPARENT + _YELLOW
 _GRAY_WITH_TRANSPARENT = _TRANSPARENT + _GRAY
 
+_MAX_GREEN_VALUE = 255
+_MIN_GREEN_VALUE = _MAX_GREEN_VALUE / 2
+_EXCESS_COLOR_CODES = [
+    f"FF{green_value:02X}7F" for green_value in range(_MAX_GREEN_VALUE + 1)
+]
+
 
 class ExcelAnalyzer:
     _logger = CustomLogger.get_logger()
+    _fill_cache: Dict[str, PatternFill] = {}
 
-    def __init__(self, workbook: Workbook) -> None:
+    def __init__(self, workbook: Workbook, threshold: int) -> None:
         self._workbook = workbook
+        self._threshold = threshold
         self._threshold_exceeded_sheets: set[str] = set()
         self._anomaly_detected_sheets: set[str] = set()
 
-    @staticmethod
-    def _highlight_cell(cell: Cell, color_code: str) -> None:
-        pattern_fill = PatternFill(start_color=color_code, fill_type="solid")
-        cell.fill = pattern_fill
+    @classmethod
+    def _get_pattern_fill(cls, color_code: str) -> PatternFill:
+        pattern_fill = cls._fill_cache.get(color_code)
+        if pattern_fill is None:
+            pattern_fill = PatternFill(
+                start_color=color_code, fill_type="solid"
+            )
+            cls._fill_cache[color_code] = pattern_fill
+        return pattern_fill
+
+    @classmethod
+    def _create_highlighted_cell(
+        cls, sheet: WriteOnlyWorksheet, value: Any, color_code: str
+    ) -> WriteOnlyCell:
+        highlighted_cell = WriteOnlyCell(sheet, value=value)
+        highlighted_cell.fill = cls._get_pattern_fill(color_code)
+        return highlighted_cell
 
     @staticmethod
     def _calculate_color_based_on_excess_ratio(
@@ -40,131 +68,135 @@ class ExcelAnalyzer:
         excess_ratio = (processing_time - threshold) / threshold
         clamped_excess_ratio = min(excess_ratio, 1)
 
-        MAX_GREEN_VALUE = 255
-        MIN_GREEN_VALUE = MAX_GREEN_VALUE / 2
         green_value = int(
-            MAX_GREEN_VALUE
-            - (MAX_GREEN_VALUE - MIN_GREEN_VALUE) * clamped_excess_ratio
+            _MAX_GREEN_VALUE
+            - (_MAX_GREEN_VALUE - _MIN_GREEN_VALUE) * clamped_excess_ratio
         )
 
-        green_hex_value = f"{green_value:02X}"
-        color_code = f"FF{green_hex_value}7F"
+        return _EXCESS_COLOR_CODES[green_value]
 
-        return color_code
+    def _parse_processing_time(self, processing_time_value: str) -> int | None:
+        try:
+            return int(processing_time_value.rstrip("s"))
+        except ValueError:
+            self._logger.warning(
+                "Invalid processing time value: %s", processing_time_value
+            )
+            return None
 
-    def _check_and_highlight_processing_time(
-        self,
-        processing_time_cell: Cell,
-        threshold: int,
+    def _highlight_processing_times(
+        self, sheet: WriteOnlyWorksheet, data_rows: List[List[Any]]
     ) -> bool:
-        processing_time_value = processing_time_cell.value
+        column = _PROCESSING_TIME_COLUMN
+        threshold = self._threshold
+        create_highlighted_cell = self._create_highlighted_cell
+        has_highlighted_cell = False
 
-        if processing_time_value:
-            try:
-                processing_time_seconds = int(
-                    processing_time_value.rstrip("s")
-                )
+        for data_row in data_rows:
+            if len(data_row) <= column or not data_row[column]:
+                continue
 
-                if processing_time_seconds >= threshold:
-                    color_code = self._calculate_color_based_on_excess_ratio(
-                        processing_time_seconds, threshold
-                    )
-                    self._highlight_cell(processing_time_cell, color_code)
-                    return True
-            except ValueError:
-                self._logger.warning(
-                    f"Invalid processing time value: {processing_time_value}"
-                )
+            processing_time = self._parse_processing_time(data_row[column])
+            if processing_time is None or processing_time < threshold:
+                continue
+
+            color_code = self._calculate_color_based_on_excess_ratio(
+                processing_time, threshold
+            )
+            data_row[column] = create_highlighted_cell(
+                sheet, data_row[column], color_code
+            )
+            has_highlighted_cell = True
+
+        return has_highlighted_cell
+
+    @staticmethod
+    def _may_contain_random_key(alert_detail_value: Any) -> bool:
+        if not isinstance(alert_detail_value, str):
+            return False
 
-        return False
+        return _RANDOM_KEY_PATTERN.search(alert_detail_value) is not None
 
-    def _check_and_highlight_alert_detail(
-        self,
-        alert_detail_cell: Cell,
+    def _check_alert_detail(self, alert_detail_value: Any) -> bool:
+        if not self._may_contain_random_key(alert_detail_value):
+            return False
+
+        try:
+            alert_detail_data = _json_loads(alert_detail_value)
+        except json.JSONDecodeError:
+            self._logger.warning(
+                "Invalid JSON format found: %s", alert_detail_value
+            )
+            return False
+
+        if not isinstance(alert_detail_data, list):
+            alert_detail_data = [alert_detail_data]
+
+        return any(
+            isinstance(item, dict) and item.get("random_key") is True
+            for item in alert_detail_data
+        )
+
+    def _highlight_alert_details(
+        self, sheet: WriteOnlyWorksheet, data_rows: List[List[Any]]
     ) -> bool:
-        alert_detail_value = alert_detail_cell.value
-
-        if alert_detail_value:
-            try:
-                alert_detail_data = json.loads(alert_detail_value)
-                if any(
-                    item.get("random_key") is True
-                    for item in alert_detail_data
-                ):
-                    self._highlight_cell(
-                        alert_detail_cell, _YELLOW_WITH_TRANSPARENT
-                    )
-                    return True
-            except json.JSONDecodeError:
-                self._logger.warning(
-                    f"Invalid JSON format found: {alert_detail_value}"
+        column = _ALERT_DETAIL_COLUMN
+        check_alert_detail = self._check_alert_detail
+        create_highlighted_cell = self._create_highlighted_cell
+        has_highlighted_cell = False
+
+        for data_row in data_rows:
+            if len(data_row) > column and check_alert_detail(data_row[column]):
+                data_row[column] = create_highlighted_cell(
+                    sheet, data_row[column], _YELLOW_WITH_TRANSPARENT
                 )
-        return False
+                has_highlighted_cell = True
+
+        return has_highlighted_cell
 
     def _log_detected_anomalies(self, sheet_name: str) -> None:
         if sheet_name in self._threshold_exceeded_sheets:
             self._logger.warning(
-                f"Processing time threshold exceeded: {sheet_name}"
+                "Processing time threshold exceeded: %s", sheet_name
             )
 
         if sheet_name in self._anomaly_detected_sheets:
-            self._logger.warning(f"Anomaly value detected: {sheet_name}")
+            self._logger.warning("Anomaly value detected: %s", sheet_name)
 
-    def highlight_cells_and_sheet_tabs_by_criteria(
-        self, threshold: int
+    def highlight_cells_and_sheet_tab_by_criteria(
+        self, sheet: WriteOnlyWorksheet, data_rows: List[List[Any]]
     ) -> None:
-        self._logger.info("Starting to highlight.")
-        total_sheets = len(self._workbook.sheetnames)
-
-        for current_sheet_number, sheet_name in enumerate(
-            self._workbook.sheetnames, start=1
-        ):
-            sheet = self._workbook[sheet_name]
-            has_highlighted_cell = False
+        sheet_name = sheet.title
+        threshold_exceeded = self._highlight_processing_times(sheet, data_rows)
+        anomaly_detected = self._highlight_alert_details(sheet, data_rows)
 
-            for row in sheet.iter_rows(min_row=_DATA_START_ROW):
-                processing_time_cell = row[_PROCESSING_TIME_COLUMN]
-                alert_detail_cell = row[_ALERT_DETAIL_COLUMN]
+        if threshold_exceeded:
+            self._threshold_exceeded_sheets.add(sheet_name)
 
-                if self._check_and_highlight_processing_time(
-                    processing_time_cell, threshold
-                ):
-                    self._threshold_exceeded_sheets.add(sheet_name)
-                    has_highlighted_cell = True
+        if anomaly_detected:
+            self._anomaly_detected_sheets.add(sheet_name)
 
-                if self._check_and_highlight_alert_detail(alert_detail_cell):
-                    self._anomaly_detected_sheets.add(sheet_name)
-                    has_highlighted_cell = True
+        if threshold_exceeded or anomaly_detected:
+            sheet.sheet_properties.tabColor = _YELLOW_WITH_TRANSPARENT
+            self._log_detected_anomalies(sheet_name)
 
-            if has_highlighted_cell:
-                sheet.sheet_properties.tabColor = _YELLOW_WITH_TRANSPARENT
-                self._log_detected_anomalies(sheet_name)
+    def _create_new_order(self) -> List[Any]:
+        yellow_sheets: List[Any] = []
+        gray_sheets: List[Any] = []
+        other_sheets: List[Any] = []
 
-            self._logger.info(
-                f"Analyzed sheet: {sheet_name}."
-                f" ({current_sheet_number}/{total_sheets})"
-            )
-        self._logger.info("Highlighting completed.")
-
-    def _create_new_order(self) -> List[str]:
-        yellow_sheets = []
-        gray_sheets = []
-        other_sheets = []
-
-        for sheet_name in self._workbook.sheetnames:
-            sheet_tab_color = self._workbook[
-                sheet_name
-            ].sheet_properties.tabColor
+        for sheet in self._workbook.worksheets:
+            sheet_tab_color = sheet.sheet_properties.tabColor
 
             if sheet_tab_color is None:
-                other_sheets.append(sheet_name)
+                other_sheets.append(sheet)
             else:
                 sheet_color_value = sheet_tab_color.value
 
                 if sheet_color_value == _YELLOW_WITH_TRANSPARENT:
-                    yellow_sheets.append(sheet_name)
+                    yellow_sheets.append(sheet)
                 elif sheet_color_value == _GRAY_WITH_TRANSPARENT:
-                    gray_sheets.append(sheet_name)
+                    gray_sheets.append(sheet)
 
         return yellow_sheets + other_sheets + gray_sheets
 
@@ -172,12 +204,21 @@ class ExcelAnalyzer:
         self._logger.info("Starting to reorder.")
         new_order = self._create_new_order()
 
+        reordered_sheets = set(new_order)
+        unordered_sheets = [
+            sheet
+            for sheet in self._workbook._sheets
+            if sheet not in reordered_sheets
+        ]
+        self._workbook._sheets = unordered_sheets + new_order
+
         total_sheets = len(self._workbook.sheetnames)
-        for current_sheet_number, sheet_name in enumerate(new_order, start=1):
-            self._workbook.move_sheet(sheet_name, total_sheets)
+        for current_sheet_number, sheet in enumerate(new_order, start=1):
             self._logger.info(
-                f"Reordered sheet: {sheet_name}."
-                f" ({current_sheet_number}/{total_sheets})"
+                "Reordered sheet: %s. (%d/%d)",
+                sheet.title,
+                current_sheet_number,
+                total_sheets,
             )
         self._logger.info("Reordering completed.")
 
@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Set, Tuple
+
+from openpyxl import Workbook
+
+from src.csv_consolidator import CSVConsolidator
+from src.custom_logger import _PROCESS_START_METHOD, CustomLogger
+from src.excel_analyzer import ExcelAnalyzer
+from src.file_utility import FileUtility
+
+_MAX_WORKERS = os.cpu_count() or 1
+
+ExcelJob = Tuple[str, Dict[str, str | None]]
+
+
+class ExcelBuilder:
+    _logger = CustomLogger.get_logger()
+
+    def __init__(self, processing_time_threshold: int) -> None:
+        self._processing_time_threshold = processing_time_threshold
+
+    @staticmethod
+    def _create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(_PROCESS_START_METHOD),
+            initializer=CustomLogger.initialize_worker,
+            initargs=(
+                CustomLogger.get_log_queue(),
+                CustomLogger.get_logger().getEffectiveLevel(),
+            ),
+        )
+
+    def _build_excel(
+        self, excel_path: str, csv_paths: Dict[str, str | None]
+    ) -> Dict[str, Set[str]]:
+        FileUtility.create_directory(excel_path)
+
+        self._logger.info("Starting to create %s.", excel_path)
+        workbook = Workbook(write_only=True)
+        excel_analyzer = ExcelAnalyzer(
+            workbook, self._processing_time_threshold
+        )
+        csv_consolidator = CSVConsolidator(workbook, excel_analyzer)
+        csv_consolidator.consolidate_csvs_to_excel(csv_paths)
+        excel_analyzer.reorder_sheets_by_color()
+
+        self._logger.info("Saving %s.", excel_path)
+        workbook.save(excel_path)
+        self._logger.info("Finished creating %s.", excel_path)
+
+        return {
+            **csv_consolidator.get_merge_failed_info(),
+            **excel_analyzer.get_analysis_results(),
+        }
+
+    def _build_unique_excels(
+        self, csv_paths_by_excel_path: Dict[str, Dict[str, str | None]]
+    ) -> Dict[str, Dict[str, Set[str]]]:
+        if len(csv_paths_by_excel_path) <= 1 or _MAX_WORKERS <= 1:
+            return {
+                excel_path: self._build_excel(excel_path, csv_paths)
+                for excel_path, csv_paths in csv_paths_by_excel_path.items()
+            }
+
+        max_workers = min(len(csv_paths_by_excel_path), _MAX_WORKERS)
+        with self._create_process_pool(max_workers) as executor:
+            futures = {
+                excel_path: executor.submit(
+                    self._build_excel, excel_path, csv_paths
+                )
+                for excel_path, csv_paths in csv_paths_by_excel_path.items()
+            }
+            return {
+                excel_path: future.result()
+                for excel_path, future in futures.items()
+            }
+
+    def build_excels(
+        self, excel_jobs: List[ExcelJob]
+    ) -> List[Dict[str, Set[str]]]:
+        csv_paths_by_excel_path = dict(excel_jobs)
+        processing_results_by_excel_path = self._build_unique_excels(
+            csv_paths_by_excel_path
+        )
+        return [
+            processing_results_by_excel_path[excel_path]
+            for excel_path, _ in excel_jobs
+        ]
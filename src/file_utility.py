@@ -1,4 +1,5 @@
 import os
+from typing import Set
 
 _EXCEL_FOLDER_PATH = os.path.join("output")
 
@@ -22,11 +23,28 @@ class FileUtility:
         os.makedirs(directory_for_file, exist_ok=True)
 
     @staticmethod
-    def get_csv_path(target_folder_path: str, date: str) -> str | None:
+    def get_file_names(folder_path: str) -> Set[str]:
+        try:
+            with os.scandir(folder_path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    @staticmethod
+    def get_csv_path(
+        target_folder_path: str,
+        date: str,
+        file_names: Set[str] | None = None,
+    ) -> str | None:
         csv_name = f"test_{date}.csv"
         csv_path = os.path.join(target_folder_path, csv_name)
 
-        if os.path.exists(csv_path):
+        if file_names is None:
+            csv_exists = os.path.isfile(csv_path)
+        else:
+            csv_exists = csv_name in file_names
+
+        if csv_exists:
             return csv_path
         else:
             return None
@@ -1,8 +1,7 @@
+import logging
 from typing import Dict, List, Set
 
-from src.csv_consolidator import CSVConsolidator
 from src.custom_logger import CustomLogger
-from src.excel_analyzer import ExcelAnalyzer
 
 
 class ProcessingSummary:
@@ -38,14 +37,8 @@ class ProcessingSummary:
                     )
 
     def save_daily_processing_results(
-        self,
-        dict_key: str,
-        csv_consolidator: CSVConsolidator,
-        excel_analyzer: ExcelAnalyzer,
+        self, dict_key: str, processing_results: Dict[str, Set[str]]
     ) -> None:
-        merge_failed_info = csv_consolidator.get_merge_failed_info()
-        analysis_results = excel_analyzer.get_analysis_results()
-
         self._daily_processing_results.setdefault(
             dict_key,
             {
@@ -56,15 +49,15 @@ class ProcessingSummary:
         )
 
         self._daily_processing_results[dict_key]["merge_failed"].update(
-            merge_failed_info["merge_failed"]
+            processing_results["merge_failed"]
         )
 
         self._daily_processing_results[dict_key]["threshold_exceeded"].update(
-            analysis_results["threshold_exceeded"]
+            processing_results["threshold_exceeded"]
         )
 
         self._daily_processing_results[dict_key]["anomaly_detected"].update(
-            analysis_results["anomaly_detected"]
+            processing_results["anomaly_detected"]
         )
 
     def _summarize_daily_processing_results(self) -> None:
@@ -92,16 +85,19 @@ class ProcessingSummary:
             self._daily_summaries.setdefault(date, []).extend(day_summary)
 
     def log_daily_summaries(self) -> None:
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return
+
         self._logger.info("Starting to log summary.")
         self._summarize_daily_processing_results()
 
         for key in sorted(self._daily_summaries.keys()):
-            self._logger.info(f"Summary for {key}:")
+            self._logger.info("Summary for %s:", key)
 
             if not self._daily_summaries[key]:
                 self._logger.info("No anomalies detected.")
             else:
                 for summary_item in self._daily_summaries[key]:
-                    self._logger.warning(f"{summary_item}")
+                    self._logger.warning("%s", summary_item)
 
         self._logger.info("Finished logging summary.")
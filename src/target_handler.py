@@ -1,6 +1,6 @@
+import bisect
 import os
-import sys
-from typing import List
+from typing import Dict, List
 
 from src.config_loader import ConfigLoader
 
@@ -9,32 +9,64 @@ _TARGET_FOLDERS_BASE_PATH = os.path.join("log_directory")
 
 class TargetHandler:
     @classmethod
-    def get_target_prefixes(cls, config_loader: ConfigLoader) -> List[str]:
-        TARGET_INDEX = 2
-        if len(sys.argv) > TARGET_INDEX:
-            targets = sys.argv[TARGET_INDEX].split(",")
+    def get_target_prefixes(
+        cls, config_loader: ConfigLoader, input_targets: str | None = None
+    ) -> List[str]:
+        if input_targets is not None:
+            targets = input_targets.split(",")
         else:
             targets = config_loader.get("targets", [])
         return targets
 
+    @staticmethod
+    def _get_sorted_target_folders() -> List[str]:
+        with os.scandir(_TARGET_FOLDERS_BASE_PATH) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+
+    @staticmethod
+    def _find_target_folders_with_prefix(
+        sorted_target_folders: List[str], target_prefix: str
+    ) -> List[str]:
+        start_index = bisect.bisect_left(sorted_target_folders, target_prefix)
+        end_index = start_index
+        while end_index < len(sorted_target_folders):
+            if not sorted_target_folders[end_index].startswith(target_prefix):
+                break
+            end_index += 1
+
+        return sorted_target_folders[start_index:end_index]
+
     @classmethod
-    def get_target_fullnames(cls, target_prefixes: List[str]) -> List[str]:
-        target_fullnames = []
-        target_folders = os.listdir(_TARGET_FOLDERS_BASE_PATH)
+    def get_target_fullnames_by_prefix(
+        cls, target_prefixes: List[str]
+    ) -> Dict[str, List[str]]:
+        target_fullnames_by_prefix = {}
+        sorted_target_folders = cls._get_sorted_target_folders()
 
         for target_prefix in target_prefixes:
-            matched_target_fullnames = [
-                target_folder
-                for target_folder in target_folders
-                if target_folder.startswith(target_prefix)
-            ]
+            matched_target_fullnames = cls._find_target_folders_with_prefix(
+                sorted_target_folders, target_prefix
+            )
 
             if matched_target_fullnames:
-                target_fullnames.extend(matched_target_fullnames)
+                target_fullnames_by_prefix[target_prefix] = (
+                    matched_target_fullnames
+                )
             else:
                 raise ValueError(
                     f"No folder starting with target prefix '{target_prefix}'"
                     " was found in the log directory."
                 )
 
-        return target_fullnames
+        return target_fullnames_by_prefix
+
+    @classmethod
+    def get_target_fullnames(cls, target_prefixes: List[str]) -> List[str]:
+        target_fullnames_by_prefix = cls.get_target_fullnames_by_prefix(
+            target_prefixes
+        )
+        return [
+            target_fullname
+            for target_fullnames in target_fullnames_by_prefix.values()
+            for target_fullname in target_fullnames
+        ]
@@ -0,0 +1,22 @@
+from typing import List, Tuple
+
+import pytest
+
+from src.argument_handler import ArgumentHandler
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["script.py"], (None, None)),
+        (["script.py", "19880209"], ("19880209", None)),
+        (
+            ["script.py", "19880209~19880210", "abc,def"],
+            ("19880209~19880210", "abc,def"),
+        ),
+    ],
+)
+def test_get_input_date_and_targets(
+    argv: List[str], expected: Tuple[str | None, str | None]
+) -> None:
+    assert ArgumentHandler.get_input_date_and_targets(argv) == expected
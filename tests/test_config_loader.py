@@ -1,5 +1,6 @@
 import logging
 import os
+import shutil
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -48,3 +49,61 @@ def test_get_processing_time_threshold_with_invalid_threshold() -> None:
     with patch.object(config_loader, "_logger", mock_logger):
         with pytest.raises(ValueError):
             config_loader.get_processing_time_threshold()
+
+
+def test_get_reuses_cached_config(tmp_path: str) -> None:
+    temp_config_path = os.path.join(tmp_path, "config.yml")
+    shutil.copy(
+        os.path.join("tests", "data", "test_config.yml"), temp_config_path
+    )
+    mock_logger = MagicMock(spec=logging.Logger)
+
+    with patch.object(ConfigLoader, "_logger", mock_logger):
+        with patch("src.config_loader.yaml.load", wraps=yaml.load) as load:
+            first_loader = ConfigLoader(temp_config_path)
+            first_loader.get("targets").append("MUTATED_TARGET")
+            second_loader = ConfigLoader(temp_config_path)
+            targets = second_loader.get("targets")
+
+    assert load.call_count == 1
+    assert "MUTATED_TARGET" not in targets
+
+
+def test_get_prefers_fresh_json_sidecar(tmp_path: str) -> None:
+    temp_config_path = os.path.join(tmp_path, "config.yml")
+    shutil.copy(
+        os.path.join("tests", "data", "test_config.yml"), temp_config_path
+    )
+    mock_logger = MagicMock(spec=logging.Logger)
+
+    with patch.object(ConfigLoader, "_logger", mock_logger):
+        expected = ConfigLoader(temp_config_path).get("targets")
+        assert os.path.exists(os.path.join(tmp_path, ".config.yml.json"))
+
+        ConfigLoader._config_cache.clear()
+        with patch("src.config_loader.yaml.load", wraps=yaml.load) as load:
+            targets = ConfigLoader(temp_config_path).get("targets")
+
+    assert load.call_count == 0
+    assert targets == expected
+
+
+def test_get_reloads_modified_config(tmp_path: str) -> None:
+    temp_config_path = os.path.join(tmp_path, "config.yml")
+    mock_logger = MagicMock(spec=logging.Logger)
+
+    with patch.object(ConfigLoader, "_logger", mock_logger):
+        with open(temp_config_path, "w") as file:
+            file.write("processing_time_threshold_seconds: 4")
+        first_threshold = ConfigLoader(
+            temp_config_path
+        ).get_processing_time_threshold()
+
+        with open(temp_config_path, "w") as file:
+            file.write("processing_time_threshold_seconds: 120")
+        second_threshold = ConfigLoader(
+            temp_config_path
+        ).get_processing_time_threshold()
+
+    assert first_threshold == 4
+    assert second_threshold == 120
@@ -1,18 +1,18 @@
 import os
 
-import pandas as pd
+from openpyxl import Workbook
 
 from src.csv_consolidator import CSVConsolidator
+from src.excel_analyzer import ExcelAnalyzer
 
 _TRANSPARENT = "FF"
 _GRAY = "7F7F7F"
 _GRAY_WITH_TRANSPARENT = _TRANSPARENT + _GRAY
 
 
-def test_consolidate_csvs_to_excel() -> None:
+def test_consolidate_csvs_to_excel(tmp_path: str) -> None:
     date = "19880209"
 
-    target_prefix = "target"
     target_with_csv = "target_0"
     target_with_no_csv = "target_1"
     target_with_invalid_csv = "target_2"
@@ -20,9 +20,6 @@ def test_consolidate_csvs_to_excel() -> None:
     csv_path = os.path.join(
         "tests", "data", target_with_csv, f"test_{date}.csv"
     )
-    excel_path = os.path.join(
-        "tests", "data", "output", f"{date}_{target_prefix}.xlsx"
-    )
 
     filtered_targets_and_csv_path = {
         target_with_csv: csv_path,
@@ -30,13 +27,11 @@ def test_consolidate_csvs_to_excel() -> None:
         target_with_invalid_csv: "INVALID_CSV_PATH.csv",
     }
 
-    with pd.ExcelWriter(excel_path, engine="openpyxl", mode="w") as writer:
-        workbook = writer.book
-
-        csv_consolidator = CSVConsolidator(writer, workbook)
-        csv_consolidator.consolidate_csvs_to_excel(
-            filtered_targets_and_csv_path
-        )
+    workbook = Workbook(write_only=True)
+    excel_analyzer = ExcelAnalyzer(workbook, 4)
+    csv_consolidator = CSVConsolidator(workbook, excel_analyzer)
+    csv_consolidator.consolidate_csvs_to_excel(filtered_targets_and_csv_path)
+    workbook.save(os.path.join(tmp_path, f"{date}_target_consolidate.xlsx"))
 
     added_sheets = workbook.sheetnames
     assert target_with_csv in added_sheets
@@ -52,3 +47,31 @@ def test_consolidate_csvs_to_excel() -> None:
         target_with_invalid_csv
         in csv_consolidator.get_merge_failed_info()["merge_failed"]
     )
+
+
+def test_consolidate_csvs_to_excel_with_empty_csv(tmp_path: str) -> None:
+    date = "19880209"
+    target_with_empty_csv = "target_0"
+    target_with_blank_csv = "target_1"
+
+    empty_csv_path = os.path.join(tmp_path, f"empty_{date}.csv")
+    with open(empty_csv_path, "w"):
+        pass
+
+    blank_csv_path = os.path.join(tmp_path, f"blank_{date}.csv")
+    with open(blank_csv_path, "w") as blank_csv:
+        blank_csv.write("\n\n")
+
+    workbook = Workbook(write_only=True)
+    excel_analyzer = ExcelAnalyzer(workbook, 4)
+    csv_consolidator = CSVConsolidator(workbook, excel_analyzer)
+    csv_consolidator.consolidate_csvs_to_excel(
+        {
+            target_with_empty_csv: empty_csv_path,
+            target_with_blank_csv: blank_csv_path,
+        }
+    )
+    assert workbook.sheetnames == []
+    assert csv_consolidator.get_merge_failed_info() == {
+        "merge_failed": {target_with_empty_csv, target_with_blank_csv}
+    }
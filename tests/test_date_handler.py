@@ -1,7 +1,5 @@
-import sys
 from datetime import datetime, timedelta
 from typing import List
-from unittest.mock import patch
 
 import pytest
 
@@ -13,46 +11,43 @@ _TOMORROW = (datetime.now() + timedelta(days=1)).strftime(_DATE_FORMAT)
 
 
 @pytest.mark.parametrize(
-    "argv, expected",
+    "input_date, expected",
     [
+        (None, [_YESTERDAY]),
+        ("19880209", ["19880209"]),
+        ("19880209~19880209", ["19880209"]),
         (
-            ["test.py"],
-            [_YESTERDAY],
-        ),
-        (["test.py", "19880209"], ["19880209"]),
-        (["test.py", "19880209~19880209"], ["19880209"]),
-        (
-            ["test.py", "19880209~19880211"],
+            "19880209~19880211",
             ["19880209", "19880210", "19880211"],
         ),
         (
-            ["test.py", "19880211~19880209"],
+            "19880211~19880209",
             ["19880209", "19880210", "19880211"],
         ),
     ],
 )
 def test_get_date_range_or_yesterday(
-    argv: List[str],
+    input_date: str | None,
     expected: List[str],
 ) -> None:
-    with patch.object(sys, "argv", argv):
-        result = DateHandler.get_date_range_or_yesterday()
-        assert result == expected
+    result = DateHandler.get_date_range_or_yesterday(input_date)
+    assert result == expected
 
 
 @pytest.mark.parametrize(
-    "argv",
+    "input_date",
     [
-        (["test.py", "1988029"]),
-        (["test.py", "1988-02-09"]),
-        (["test.py", "1988~02~09"]),
-        (["test.py", _TOMORROW]),
-        (["test.py", "invalid_date"]),
+        ("1988029"),
+        ("1988-02-09"),
+        ("1988~02~09"),
+        ("19880230"),
+        ("19881301"),
+        (_TOMORROW),
+        ("invalid_date"),
     ],
 )
 def test_get_date_range_or_yesterday_with_invalid_dates(
-    argv: List[str],
+    input_date: str,
 ) -> None:
-    with patch.object(sys, "argv", argv):
-        with pytest.raises(ValueError):
-            DateHandler.get_date_range_or_yesterday()
+    with pytest.raises(ValueError):
+        DateHandler.get_date_range_or_yesterday(input_date)
@@ -1,11 +1,13 @@
 import os
 import shutil
-from typing import List
+from typing import Dict, List
 
 import pandas as pd
-from openpyxl import Workbook
+import pytest
+from openpyxl import Workbook, load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
+from src.csv_consolidator import CSVConsolidator
 from src.excel_analyzer import ExcelAnalyzer
 
 _TRANSPARENT = "FF"
@@ -27,7 +29,7 @@ def _initialize_excel_data(file_name_without_extension: str) -> None:
     shutil.copy(original_excel_path, excel_path)
 
 
-def test_highlight_cells_and_sheet_tabs_by_criteria() -> None:
+def test_highlight_cells_and_sheet_tab_by_criteria(tmp_path: str) -> None:
     def _check_cell_highlighting(
         worksheet: Worksheet, highlighted_cells: List[str]
     ) -> None:
@@ -47,39 +49,47 @@ def test_highlight_cells_and_sheet_tabs_by_criteria() -> None:
             assert worksheet.sheet_properties.tabColor is None
 
     date = "19880209"
-    excel_path = os.path.join(
-        "tests", "data", date, f"{date}_target_highlight.xlsx"
-    )
+    excel_path = os.path.join(tmp_path, f"{date}_target_highlight.xlsx")
     processing_time_threshold = 4
+    csv_paths: Dict[str, str | None] = {
+        target: os.path.join("tests", "data", target, f"test_{date}.csv")
+        for target in ["target_0", "target_1", "target_2", "target_3"]
+    }
+    csv_paths["no_csv"] = None
 
-    _initialize_excel_data("19880209_target_highlight")
-    with pd.ExcelWriter(excel_path, engine="openpyxl", mode="a") as writer:
-        workbook = writer.book
+    workbook = Workbook(write_only=True)
+    excel_analyzer = ExcelAnalyzer(workbook, processing_time_threshold)
+    CSVConsolidator(workbook, excel_analyzer).consolidate_csvs_to_excel(
+        csv_paths
+    )
+    workbook.save(excel_path)
+
+    saved_workbook = load_workbook(excel_path)
 
-        excel_analyzer = ExcelAnalyzer(workbook)
-        excel_analyzer.highlight_cells_and_sheet_tabs_by_criteria(
-            processing_time_threshold
-        )
+    worksheet = saved_workbook["target_0"]
+    _check_cell_highlighting(worksheet, [])
+    _check_sheet_tab_color(worksheet, None)
 
-        worksheet = workbook["target_0"]
-        _check_cell_highlighting(worksheet, [])
-        _check_sheet_tab_color(worksheet, None)
+    worksheet = saved_workbook["target_1"]
+    _check_cell_highlighting(worksheet, ["D2"])
+    _check_sheet_tab_color(worksheet, _YELLOW_WITH_TRANSPARENT)
 
-        worksheet = workbook["target_1"]
-        _check_cell_highlighting(worksheet, ["D2"])
-        _check_sheet_tab_color(worksheet, _YELLOW_WITH_TRANSPARENT)
+    worksheet = saved_workbook["target_2"]
+    _check_cell_highlighting(worksheet, ["C2"])
+    _check_sheet_tab_color(worksheet, _YELLOW_WITH_TRANSPARENT)
 
-        worksheet = workbook["target_2"]
-        _check_cell_highlighting(worksheet, ["C2"])
-        _check_sheet_tab_color(worksheet, _YELLOW_WITH_TRANSPARENT)
+    worksheet = saved_workbook["target_3"]
+    _check_cell_highlighting(worksheet, ["C2", "D2"])
+    _check_sheet_tab_color(worksheet, _YELLOW_WITH_TRANSPARENT)
 
-        worksheet = workbook["target_3"]
-        _check_cell_highlighting(worksheet, ["C2", "D2"])
-        _check_sheet_tab_color(worksheet, _YELLOW_WITH_TRANSPARENT)
+    worksheet = saved_workbook["no_csv"]
+    _check_cell_highlighting(worksheet, [])
+    _check_sheet_tab_color(worksheet, _GRAY_WITH_TRANSPARENT)
 
-        worksheet = workbook["no_csv"]
-        _check_cell_highlighting(worksheet, [])
-        _check_sheet_tab_color(worksheet, _GRAY_WITH_TRANSPARENT)
+    assert excel_analyzer.get_analysis_results() == {
+        "threshold_exceeded": {"target_2", "target_3"},
+        "anomaly_detected": {"target_1", "target_3"},
+    }
 
 
 def test_reorder_sheets_by_color() -> None:
@@ -92,13 +102,16 @@ def test_reorder_sheets_by_color() -> None:
     with pd.ExcelWriter(excel_path, engine="openpyxl", mode="a") as writer:
         workbook = writer.book
 
-        excel_analyzer = ExcelAnalyzer(workbook)
+        excel_analyzer = ExcelAnalyzer(workbook, 4)
         excel_analyzer.reorder_sheets_by_color()
 
+        expected = ["target_1", "target_2", "target_3", "target_0", "no_csv"]
+        assert workbook.sheetnames == expected
+
 
 def test_get_analysis_results() -> None:
     workbook = Workbook()
-    excel_analyzer = ExcelAnalyzer(workbook)
+    excel_analyzer = ExcelAnalyzer(workbook, 4)
 
     excel_analyzer._threshold_exceeded_sheets = {"target_1", "target_3"}
     excel_analyzer._anomaly_detected_sheets = {"target_2"}
@@ -110,3 +123,55 @@ def test_get_analysis_results() -> None:
 
     actual = excel_analyzer.get_analysis_results()
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "alert_detail_value, expected",
+    [
+        ('[{"random_key": true}]', True),
+        ('{"random_key" :\ttrue}', True),
+        ('[{"random_key": false, "other_key": true}]', False),
+        ('[{"other_key": true}]', False),
+        (None, False),
+    ],
+)
+def test_may_contain_random_key(
+    alert_detail_value: str | None, expected: bool
+) -> None:
+    actual = ExcelAnalyzer._may_contain_random_key(alert_detail_value)
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "processing_time_value, expected",
+    [
+        ("5s", 5),
+        (" 5s", 5),
+        ("+5s", 5),
+        ("1_0s", 10),
+        ("99999999999999999999s", 99999999999999999999),
+        ("²s", None),
+        ("5s ", None),
+        ("s", None),
+    ],
+)
+def test_parse_processing_time(
+    processing_time_value: str, expected: int | None
+) -> None:
+    excel_analyzer = ExcelAnalyzer(Workbook(), 4)
+
+    actual = excel_analyzer._parse_processing_time(processing_time_value)
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "processing_time, expected",
+    [(4, "FFFF7F"), (6, "FFBF7F"), (99999999999999999999, "FF7F7F")],
+)
+def test_calculate_color_based_on_excess_ratio(
+    processing_time: int, expected: str
+) -> None:
+    actual = ExcelAnalyzer._calculate_color_based_on_excess_ratio(
+        processing_time, 4
+    )
+    assert actual == expected
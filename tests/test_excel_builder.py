@@ -0,0 +1,111 @@
+import os
+from typing import Dict, List, Set
+
+import pytest
+from openpyxl import load_workbook
+
+from src.custom_logger import CustomLogger
+from src.excel_builder import ExcelBuilder, ExcelJob
+
+
+def _create_excel_jobs(tmp_path: str) -> List[ExcelJob]:
+    date = "19880209"
+    return [
+        (
+            os.path.join(tmp_path, date, f"{date}_target_1.xlsx"),
+            {
+                "target_1": os.path.join(
+                    "tests", "data", "target_1", f"test_{date}.csv"
+                ),
+                "target_4": None,
+            },
+        ),
+        (
+            os.path.join(tmp_path, date, f"{date}_target_2.xlsx"),
+            {
+                "target_2": os.path.join(
+                    "tests", "data", "target_2", f"test_{date}.csv"
+                ),
+            },
+        ),
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_build_excels(
+    tmp_path: str, max_workers: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("src.excel_builder._MAX_WORKERS", max_workers)
+    excel_jobs = _create_excel_jobs(tmp_path)
+
+    excel_builder = ExcelBuilder(4)
+    processing_results = excel_builder.build_excels(excel_jobs)
+
+    assert processing_results == [
+        {
+            "merge_failed": set(),
+            "threshold_exceeded": set(),
+            "anomaly_detected": {"target_1"},
+        },
+        {
+            "merge_failed": set(),
+            "threshold_exceeded": {"target_2"},
+            "anomaly_detected": set(),
+        },
+    ]
+    assert load_workbook(excel_jobs[0][0]).sheetnames == [
+        "target_1",
+        "target_4",
+    ]
+    assert load_workbook(excel_jobs[1][0]).sheetnames == ["target_2"]
+
+
+def test_build_excels_logs_each_worker_record_once(
+    tmp_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("src.excel_builder._MAX_WORKERS", 2)
+    excel_jobs = _create_excel_jobs(tmp_path)
+    log_file_path = os.path.join(tmp_path, "test.log")
+
+    CustomLogger.configure(log_file_path)
+    try:
+        ExcelBuilder(4).build_excels(excel_jobs)
+    finally:
+        CustomLogger.close()
+
+    with open(log_file_path) as log_file:
+        messages = [line.rstrip("\n").split(" - ", 2)[2] for line in log_file]
+
+    for excel_path, _ in excel_jobs:
+        assert messages.count(f"Starting to create {excel_path}.") == 1
+        assert messages.count(f"Finished creating {excel_path}.") == 1
+    assert messages.count("Added sheet: target_1. (1/2)") == 1
+    assert messages.count("Added sheet: target_4. (2/2)") == 1
+    assert messages.count("Added sheet: target_2. (1/1)") == 1
+
+
+def test_build_excels_builds_duplicate_jobs_once(
+    tmp_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    built_excel_paths: List[str] = []
+    original_build_excel = ExcelBuilder._build_excel
+
+    def _record_build_excel(
+        excel_builder: ExcelBuilder,
+        excel_path: str,
+        csv_paths: Dict[str, str | None],
+    ) -> Dict[str, Set[str]]:
+        built_excel_paths.append(excel_path)
+        return original_build_excel(excel_builder, excel_path, csv_paths)
+
+    monkeypatch.setattr("src.excel_builder._MAX_WORKERS", 1)
+    monkeypatch.setattr(ExcelBuilder, "_build_excel", _record_build_excel)
+    excel_job, other_excel_job = _create_excel_jobs(tmp_path)
+
+    processing_results = ExcelBuilder(4).build_excels(
+        [excel_job, other_excel_job, excel_job]
+    )
+
+    assert built_excel_paths == [excel_job[0], other_excel_job[0]]
+    assert len(processing_results) == 3
+    assert processing_results[0] == processing_results[2]
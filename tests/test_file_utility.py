@@ -49,3 +49,33 @@ def test_get_csv_pathh(
 ) -> None:
     result = FileUtility.get_csv_path(target_folder_path, date)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "file_names, expected",
+    [
+        ({"test_19880209.csv"}, "tests/data/target_4/test_19880209.csv"),
+        ({"test_19880210.csv"}, None),
+    ],
+)
+def test_get_csv_path_with_file_names(
+    file_names: set[str], expected: str | None
+) -> None:
+    result = FileUtility.get_csv_path(
+        "tests/data/target_4/", "19880209", file_names
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "folder_path, expected",
+    [
+        (
+            "tests/data/target_0/",
+            {"test_19880209.csv", "test_19880210.csv"},
+        ),
+        ("tests/data/target_4/", set()),
+    ],
+)
+def test_get_file_names(folder_path: str, expected: set[str]) -> None:
+    assert FileUtility.get_file_names(folder_path) == expected
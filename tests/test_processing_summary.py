@@ -1,12 +1,9 @@
 import logging
 from typing import List
-from unittest.mock import MagicMock
 
 import pytest
 from pytest import LogCaptureFixture
 
-from src.csv_consolidator import CSVConsolidator
-from src.excel_analyzer import ExcelAnalyzer
 from src.processing_summary import ProcessingSummary
 
 
@@ -112,19 +109,14 @@ def test_add_missing_csv_info_with_existing_csvs(
 def test_save_daily_processing_results() -> None:
     processing_summary = ProcessingSummary()
 
-    csv_consolidator = MagicMock(spec=CSVConsolidator)
-    excel_analyzer = MagicMock(spec=ExcelAnalyzer)
-
-    csv_consolidator.get_merge_failed_info.return_value = {
-        "merge_failed": {"target_0", "target_1"}
-    }
-    excel_analyzer.get_analysis_results.return_value = {
+    processing_results = {
+        "merge_failed": {"target_0", "target_1"},
         "threshold_exceeded": {"target_2"},
         "anomaly_detected": {"target_3"},
     }
 
     processing_summary.save_daily_processing_results(
-        "19880209", csv_consolidator, excel_analyzer
+        "19880209", processing_results
     )
 
     expected = {
@@ -179,3 +171,28 @@ def test_log_daily_summaries(caplog: LogCaptureFixture) -> None:
     assert "No anomalies detected." in logs
 
     assert "Finished logging summary." in logs
+
+
+def test_log_daily_summaries_skips_suppressed_levels(
+    caplog: LogCaptureFixture,
+) -> None:
+    processing_summary = ProcessingSummary()
+    processing_summary._daily_processing_results = {
+        "19880209": {
+            "threshold_exceeded": {"target_0"},
+            "anomaly_detected": set(),
+            "merge_failed": set(),
+        },
+    }
+
+    logger = processing_summary._logger
+    original_level = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        with caplog.at_level(logging.INFO):
+            processing_summary.log_daily_summaries()
+    finally:
+        logger.setLevel(original_level)
+
+    assert caplog.records == []
+    assert processing_summary._daily_summaries == {}
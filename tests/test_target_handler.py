@@ -8,22 +8,22 @@ from src.target_handler import ConfigLoader, TargetHandler
 
 
 @pytest.mark.parametrize(
-    "argv, config_targets, expected",
+    "input_targets, config_targets, expected",
     [
         (
-            ["test.py", "19880209", "target1,target2"],
+            "target1,target2",
             None,
             ["target1", "target2"],
         ),
         (
-            ["test.py"],
+            None,
             ["config_target1", "config_target2"],
             ["config_target1", "config_target2"],
         ),
     ],
 )
 def test_get_target_prefixes(
-    argv: List[str],
+    input_targets: str | None,
     config_targets: List[str] | None,
     expected: List[str],
 ) -> None:
@@ -31,9 +31,10 @@ def test_get_target_prefixes(
     if config_targets:
         mock_config_loader.get.return_value = config_targets
 
-    with patch("sys.argv", argv):
-        target_prefixes = TargetHandler.get_target_prefixes(mock_config_loader)
-        assert target_prefixes == expected
+    target_prefixes = TargetHandler.get_target_prefixes(
+        mock_config_loader, input_targets
+    )
+    assert target_prefixes == expected
 
 
 @pytest.mark.parametrize(
@@ -56,6 +57,23 @@ def test_get_target_fullnames(
         assert host_fullnames == expected
 
 
+def test_get_target_fullnames_by_prefix() -> None:
+    test_folders_base_path = os.path.join("tests", "data")
+    with patch(
+        "src.target_handler._TARGET_FOLDERS_BASE_PATH",
+        test_folders_base_path,
+    ):
+        target_fullnames_by_prefix = (
+            TargetHandler.get_target_fullnames_by_prefix(
+                ["target_1", "target_3"]
+            )
+        )
+        assert target_fullnames_by_prefix == {
+            "target_1": ["target_1"],
+            "target_3": ["target_3"],
+        }
+
+
 def test_get_target_fullnames_with_nonexistent_target() -> None:
     test_folders_base_path = os.path.join("tests", "data")
     with patch(